@@ -8,6 +8,7 @@ import shutil
 import sys
 import platform
 import glob
+import json
 from PIL import Image
 
 def get_project_root():
@@ -107,6 +108,19 @@ def verify_files():
             print(f"  - {file}")
         raise FileNotFoundError("Required files are missing")
 
+def write_version_module():
+    """Embed the version from version.json as src/_version.py"""
+    with open('version.json', 'r') as f:
+        version_data = json.load(f)
+    version = f"{version_data['major']}.{version_data['minor']}.{version_data['patch']}"
+    with open('src/_version.py', 'w') as f:
+        f.write(f'"""Version generated at build time."""\n\n__version__ = "{version}"\n')
+
+def remove_version_module():
+    """Remove the generated src/_version.py"""
+    if os.path.exists('src/_version.py'):
+        os.remove('src/_version.py')
+
 def build_macos_app():
     """Build macOS app using py2app."""
     try:
@@ -115,6 +129,7 @@ def build_macos_app():
         
         # Copy version.json to src directory
         shutil.copy('version.json', 'src/version.json')
+        write_version_module()
         
         # Build command
         build_cmd = [
@@ -138,6 +153,7 @@ def build_macos_app():
         # Clean up copied version.json
         if os.path.exists('src/version.json'):
             os.remove('src/version.json')
+        remove_version_module()
 
 def build_windows_app():
     """Build Windows executable using PyInstaller."""
@@ -145,6 +161,8 @@ def build_windows_app():
         # Clean previous builds
         clean_build()
         
+        write_version_module()
+        
         # Prepare spec file content
         spec_content = f'''# -*- mode: python ; coding: utf-8 -*-
 
@@ -154,11 +172,13 @@ a = Analysis(
     binaries=[],
     datas=[
         ('assets/app_icon.ico', 'assets'),
+        ('assets/app_icon_128.png', 'assets'),
         ('version.json', '.'),
         ('src/config/config.json', 'src/config')
     ],
     hiddenimports=[
         'PIL._tkinter_finder',
+        'src._version',
         'tkinter',
         'tkinter.ttk',
         'PIL',
@@ -262,6 +282,8 @@ coll = COLLECT(
     except Exception as e:
         print(f"\nUnexpected error: {str(e)}")
         sys.exit(1)
+    finally:
+        remove_version_module()
 
 def verify_environment():
     """Verify the build environment"""
@@ -21,7 +21,10 @@ framework_base = '/opt/homebrew/opt/python@3.11/Frameworks/Python.framework/Vers
 APP = [os.path.join(project_root, 'src/main.py')]
 DATA_FILES = [
     ('src/config', [os.path.join(project_root, 'src/config/config.json')]),
-    ('assets', [os.path.join(project_root, 'assets/app_icon.icns')]),
+    ('assets', [
+        os.path.join(project_root, 'assets/app_icon.icns'),
+        os.path.join(project_root, 'assets/app_icon_128.png')
+    ]),
     ('', [os.path.join(project_root, 'version.json')])
 ]
 
@@ -20,7 +20,7 @@ class AppConfig:
         return cls(
             APP_DATA_PATH=app_data_path,
             CONFIG_FILE=os.path.join(app_data_path, 'config.json'),
-            CACHE_FILE=os.path.join(app_data_path, 'lyrics_cache.pkl')
+            CACHE_FILE=os.path.join(app_data_path, 'lyrics_cache.sqlite')
         )
     
     @staticmethod
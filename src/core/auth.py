@@ -2,7 +2,7 @@
 
 import json
 import os
-from typing import Optional
+from typing import Dict, Optional
 
 from ..config.app_config import AppConfig
 
@@ -11,17 +11,22 @@ class SpotifyAuthenticator:
     
     def __init__(self, config: AppConfig):
         self.config = config
+        self._config: Optional[Dict] = None
     
     def load_cookie(self) -> Optional[str]:
         """Load SP_DC cookie from config file."""
-        if os.path.exists(self.config.CONFIG_FILE):
-            try:
-                with open(self.config.CONFIG_FILE, 'r') as f:
-                    config = json.load(f)
-                    return config.get('sp_dc')
-            except Exception:
-                return None
-        return None
+        if self._config is None:
+            self._config = self._read_config()
+        return self._config.get('sp_dc')
+    
+    def _read_config(self) -> Dict:
+        """Read the config file once, returning an empty config on failure."""
+        try:
+            with open(self.config.CONFIG_FILE, 'rb') as f:
+                config = json.loads(f.read())
+            return config if isinstance(config, dict) else {}
+        except Exception:
+            return {}
     
     def save_cookie(self, sp_dc: str) -> None:
         """Save SP_DC cookie to config file."""
@@ -29,5 +34,7 @@ class SpotifyAuthenticator:
         if config_dir:
             os.makedirs(config_dir, exist_ok=True)
         
+        config = {'sp_dc': sp_dc}
         with open(self.config.CONFIG_FILE, 'w') as f:
-            json.dump({'sp_dc': sp_dc}, f) 
\ No newline at end of file
+            json.dump(config, f)
+        self._config = config
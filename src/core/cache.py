@@ -2,41 +2,103 @@
 
 import os
 import pickle
+import sqlite3
+import threading
+import time
 from typing import Dict, List, Optional
 
 from ..config.app_config import AppConfig
 
 class LyricsCache:
-    """Manages caching of translated lyrics."""
-    
+    """Manages caching of translated lyrics in a SQLite database."""
+
     def __init__(self, cache_file: str, max_size: int):
         self.cache_file = cache_file
         self.max_size = max_size
-        self.cache: Dict[str, List[Dict]] = {}
-        self.load_cache()
-    
-    def load_cache(self) -> None:
-        """Load cached lyrics from file."""
-        if os.path.exists(self.cache_file) and os.path.getsize(self.cache_file) > 0:
-            try:
-                with open(self.cache_file, 'rb') as f:
-                    self.cache = pickle.load(f)
-            except (EOFError, pickle.UnpicklingError):
-                os.remove(self.cache_file)
-                self.cache = {}
-    
-    def save_cache(self) -> None:
-        """Save cached lyrics to file."""
-        with open(self.cache_file, 'wb') as f:
-            pickle.dump(self.cache, f)
-    
+        # Translations are written from a worker thread, lookups from the GUI thread
+        self._lock = threading.Lock()
+        self._closed = False
+        self._remove_legacy_cache()
+        try:
+            self._db = self._open_db()
+        except sqlite3.Error as e:
+            # e.g. the file is locked by another instance; run without a cache
+            print(f"Lyrics cache unavailable, continuing without it: {e}")
+            self._closed = True
+
+    def _connect(self) -> sqlite3.Connection:
+        """Connect to the cache database and create the cache table if needed."""
+        db = sqlite3.connect(self.cache_file, isolation_level=None, check_same_thread=False)
+        try:
+            db.execute('PRAGMA journal_mode=WAL')
+            db.execute(
+                'CREATE TABLE IF NOT EXISTS lyrics('
+                'song_id TEXT PRIMARY KEY, data BLOB, ts INTEGER)'
+            )
+        except sqlite3.Error:
+            db.close()
+            raise
+        return db
+
+    def _open_db(self) -> sqlite3.Connection:
+        """Open the cache database, starting over once if the file is not a database."""
+        try:
+            return self._connect()
+        except sqlite3.OperationalError:
+            # Locked or I/O errors say nothing about the file contents; keep it
+            raise
+        except sqlite3.DatabaseError:
+            # Not a valid database (e.g. a corrupt file); start over
+            open(self.cache_file, 'wb').close()
+            return self._connect()
+
+    def _remove_legacy_cache(self) -> None:
+        """Delete the pickle cache used before the SQLite cache."""
+        legacy_file = os.path.join(os.path.dirname(self.cache_file), 'lyrics_cache.pkl')
+        try:
+            os.remove(legacy_file)
+        except OSError:
+            pass
+
     def add_lyrics(self, song_id: str, lyrics: List[Dict]) -> None:
         """Add translated lyrics to cache."""
-        self.cache[song_id] = lyrics
-        if len(self.cache) > self.max_size:
-            self.cache.pop(next(iter(self.cache)))
-        self.save_cache()
-    
+        with self._lock:
+            # A translation thread may finish after the app has closed the cache
+            if self._closed:
+                return
+            self._db.execute(
+                'INSERT OR REPLACE INTO lyrics(song_id, data, ts) VALUES (?, ?, ?)',
+                (song_id, pickle.dumps(lyrics), time.time_ns())
+            )
+            self._db.execute(
+                'DELETE FROM lyrics WHERE song_id NOT IN '
+                '(SELECT song_id FROM lyrics ORDER BY ts DESC LIMIT ?)',
+                (self.max_size,)
+            )
+
     def get_lyrics(self, song_id: str) -> Optional[List[Dict]]:
         """Get cached lyrics for a song."""
-        return self.cache.get(song_id) 
\ No newline at end of file
+        with self._lock:
+            if self._closed:
+                return None
+            row = self._db.execute(
+                'SELECT data FROM lyrics WHERE song_id = ?', (song_id,)
+            ).fetchone()
+            if row is not None:
+                # Mark as recently used so eviction drops the least recently used songs
+                self._db.execute(
+                    'UPDATE lyrics SET ts = ? WHERE song_id = ?', (time.time_ns(), song_id)
+                )
+        if row is None:
+            return None
+        try:
+            return pickle.loads(row[0])
+        except (EOFError, pickle.UnpicklingError):
+            return None
+
+    def close(self) -> None:
+        """Close the cache database."""
+        with self._lock:
+            if not self._closed:
+                self._closed = True
+                self._db.close()
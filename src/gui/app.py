@@ -3,7 +3,7 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Dict, List, Optional, Tuple
 
 import sv_ttk
@@ -16,7 +16,7 @@ from src.core.cache import LyricsCache
 from src.gui.components.lyrics_view import LyricsView
 from src.gui.components.player_info import PlayerInfo
 from src.gui.components.dialogs import LoginDialog, AboutDialog
-from src.gui.styles import configure_styles
+from src.gui.styles import configure_styles, configure_dialog_styles
 from src.gui.utils.font_manager import FontManager
 
 class SpotifyLyricsTranslator:
@@ -39,6 +39,8 @@ class SpotifyLyricsTranslator:
             
             # GUI state variables
             self.current_song_id: Optional[str] = None
+            self._last_position: int = 0
+            self._resize_after: Optional[str] = None
             self.translation_complete: bool = False
             self.language: str = ""
             
@@ -113,6 +115,8 @@ Error type: {type(e)}
                 print(f"Error type: {type(e)}")
                 messagebox.showerror("Authentication Failed", error_message)
 
+        # The main GUI styles are not configured yet when logging in
+        configure_dialog_styles(ttk.Style(self.root))
         LoginDialog(self.root, on_cookie_save)
 
     def initialize_main_gui(self) -> None:
@@ -131,6 +135,17 @@ Error type: {type(e)}
             main_container = ttk.Frame(self.root, padding="10")
             main_container.pack(fill=tk.BOTH, expand=True)
             
+            # Shared translator, reused for every song
+            self._translator = GoogleTranslator(source='auto', target='en')
+            self._translator_lock = threading.Lock()
+            
+            # Persistent pool for per-line translation when a batch request fails
+            self._translate_pool = ThreadPoolExecutor(max_workers=4)
+            self._worker_translators = threading.local()
+            
+            # Worker thread for Spotify requests made on song changes
+            self._io_executor = ThreadPoolExecutor(max_workers=1)
+            
             # Initialize components
             self.player_info = PlayerInfo(main_container, self.font_manager)
             self.lyrics_view = LyricsView(main_container, self.font_manager)
@@ -152,6 +167,9 @@ Error type: {type(e)}
             # Register font change callback
             self.font_manager.register_callback(self._update_fonts)
             
+            # Stop background workers when the window is closed
+            self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+            
             # Start update loop
             self.root.after(500, self.update_display)
             
@@ -223,7 +241,9 @@ Error type: {type(e)}
         else:
             self._clear_display()
         
-        self.root.after(500, self.update_display)
+        # Poll less often while nothing is playing
+        delay = 500 if current_song and current_song.get('is_playing') else 2000
+        self.root.after(delay, self.update_display)
 
     def _get_current_playback_position(self) -> Tuple[Optional[Dict], int]:
         """Get current playback position from Spotify."""
@@ -240,6 +260,11 @@ Error type: {type(e)}
         song_id = current_song['item']['id']
         duration = current_song['item']['duration_ms']
         
+        # Nothing visible changes if the song and position are (almost) the same
+        if song_id == self.current_song_id and abs(current_position - self._last_position) < 250:
+            return
+        self._last_position = current_position
+        
         # Update player info
         self.player_info.update_song_info(current_song)
         self.player_info.update_progress(current_position, duration)
@@ -247,33 +272,46 @@ Error type: {type(e)}
         # Update lyrics if song changed
         if song_id != self.current_song_id:
             self.current_song_id = song_id
-            self._update_lyrics()
+            self._update_lyrics(current_song)
         
         # Update currently playing line
         self.lyrics_view.update_current_lyric(current_position)
 
     def _clear_display(self) -> None:
         """Clear the display when no song is playing."""
+        # Forget the song so the next successful tick redraws it and reloads lyrics
+        self.current_song_id = None
         self.player_info.clear_display()
         self.lyrics_view.clear()
         self.lyrics_view.insert_message("0:00", "(No song playing)")
 
-    def _update_lyrics(self) -> None:
-        """Update lyrics display."""
+    def _update_lyrics(self, current_song: Dict) -> None:
+        """Fetch lyrics for the current song without blocking the GUI."""
+        print("\n=== Starting lyrics update process ===")
+        song_id = current_song['item']['id']
+        song_name = current_song['item']['name']
+        
+        self.lyrics_view.clear()
+        self.lyrics_view.insert_message("0:00", "(Loading lyrics...)")
+        
+        future = self._io_executor.submit(self._fetch_lyrics, song_id)
+        future.add_done_callback(
+            lambda f: self.root.after(0, self._apply_lyrics, song_id, song_name, f))
+
+    def _fetch_lyrics(self, song_id: str) -> Tuple[Optional[Dict], Optional[List[Dict]]]:
+        """Fetch lyrics and cached translations. Runs on the I/O worker thread."""
+        lyrics = self.sp.get_lyrics(song_id)
+        cached_lyrics = self.lyrics_cache.get_lyrics(song_id)
+        return lyrics, cached_lyrics
+
+    def _apply_lyrics(self, song_id: str, song_name: str, future: Future) -> None:
+        """Display fetched lyrics. Runs on the Tk thread."""
+        if song_id != self.current_song_id:
+            # The song changed while lyrics were being fetched
+            return
+        
         try:
-            print("\n=== Starting lyrics update process ===")
-            current_song = self.sp.get_current_song()
-            print(f"Current song data retrieved: {bool(current_song)}")
-            
-            if not current_song or 'item' not in current_song:
-                self.lyrics_view.clear()
-                self.lyrics_view.insert_message("0:00", "(No song playing)")
-                return
-            
-            song_id = current_song['item']['id']
-            song_name = current_song['item']['name']
-            
-            lyrics = self.sp.get_lyrics(song_id)
+            lyrics, cached_lyrics = future.result()
             if not lyrics or not isinstance(lyrics, dict) or 'lyrics' not in lyrics:
                 self.lyrics_view.clear()
                 self.lyrics_view.insert_message("0:00", "(No lyrics available)")
@@ -288,9 +326,10 @@ Error type: {type(e)}
             # Display lyrics
             self.lyrics_view.clear()
             self.lyrics_view.display_lyrics(lyrics_data, lyrics['lyrics'].get('language', 'unknown'))
+            # Highlight now; the update loop skips ticks where the position is unchanged
+            self.lyrics_view.update_current_lyric(self._last_position)
             
             # Handle translations
-            cached_lyrics = self.lyrics_cache.get_lyrics(song_id)
             if cached_lyrics:
                 print("Using cached translations")
                 self.lyrics_view.update_translations(cached_lyrics)
@@ -307,42 +346,89 @@ Error type: {type(e)}
 
     def _translate_lyrics(self, lyrics: List[Dict], song_name: str, song_id: str) -> None:
         """Translate lyrics in a background thread."""
-        def translate_line(translator: GoogleTranslator, line: Dict) -> Dict:
-            original_text = line['words']
+        def translate_line(original_text: str) -> str:
+            # Runs on the translation pool; each worker has its own translator
+            translator = getattr(self._worker_translators, 'translator', None)
+            if translator is None:
+                translator = GoogleTranslator(source='auto', target='en')
+                self._worker_translators.translator = translator
             try:
-                translated_text = translator.translate(original_text)
+                return translator.translate(original_text)
             except Exception as e:
                 print(f"Error translating '{original_text}': {e}")
-                translated_text = original_text
-            return {
-                'startTimeMs': line['startTimeMs'],
-                'words': original_text,
-                'translated': translated_text
-            }
+                return original_text
+
+        def translate_batch(translator: GoogleTranslator, originals: List[str]) -> List[str]:
+            # Send the whole song as one request and split it back into lines;
+            # fall back to per-line requests if the line structure is not kept.
+            # The translator strips its input, so blank lines are left out of the
+            # request and keep their original text.
+            indices = [i for i, text in enumerate(originals) if text.strip()]
+            texts = [originals[i].strip() for i in indices]
+            translated = list(originals)
+            if not texts:
+                return translated
+            
+            try:
+                # GoogleTranslator keeps request parameters on the instance,
+                # so songs translating concurrently must take turns with it.
+                with self._translator_lock:
+                    parts = translator.translate("\n".join(texts)).split("\n")
+                if len(parts) == len(texts):
+                    for i, text in zip(indices, parts):
+                        translated[i] = text
+                    return translated
+                print("Batch translation changed line count, translating per line")
+            except Exception as e:
+                print(f"Error in batch translation: {e}")
+
+            try:
+                for i, text in zip(indices, self._translate_pool.map(translate_line, texts)):
+                    translated[i] = text
+            except RuntimeError:
+                # The pool was shut down because the app is closing
+                pass
+            return translated
 
         def translate():
-            translator = GoogleTranslator(source='auto', target='en')
-            with ThreadPoolExecutor(max_workers=4) as executor:
-                futures = [
-                    executor.submit(translate_line, translator, line)
-                    for line in lyrics
-                ]
-                translated_lyrics = [future.result() for future in as_completed(futures)]
+            originals = [line['words'] for line in lyrics]
+            translated = translate_batch(self._translator, originals)
+            translated_lyrics = [
+                {
+                    'startTimeMs': line['startTimeMs'],
+                    'words': line['words'],
+                    'translated': text or line['words']
+                }
+                for line, text in zip(lyrics, translated)
+            ]
             
             self.lyrics_cache.add_lyrics(song_id, translated_lyrics)
-            self.root.after(0, lambda: self.lyrics_view.update_translations(translated_lyrics))
+            self.root.after(0, lambda: self._apply_translations(song_id, translated_lyrics))
 
         threading.Thread(target=translate, daemon=True).start()
 
+    def _apply_translations(self, song_id: str, translated_lyrics: List[Dict]) -> None:
+        """Show translations if their song is still the one displayed."""
+        if song_id == self.current_song_id:
+            self.lyrics_view.update_translations(translated_lyrics)
+
     def _on_window_resize(self, event: tk.Event) -> None:
         """Handle window resize event."""
-        if event.widget == self.root:
-            self.lyrics_view.adjust_column_widths(self.root.winfo_width())
+        if event.widget != self.root:
+            return
+        # <Configure> fires continuously while dragging; only act on the last one
+        if self._resize_after is not None:
+            self.root.after_cancel(self._resize_after)
+        self._resize_after = self.root.after(150, self._do_resize)
+
+    def _do_resize(self) -> None:
+        """Adjust column widths once the window has stopped resizing."""
+        self._resize_after = None
+        self.lyrics_view.adjust_column_widths(self.root.winfo_width())
 
     def _show_tooltip(self, event: tk.Event) -> None:
         """Show tooltip for truncated text."""
-        # Implementation moved to LyricsView class
-        pass
+        self.lyrics_view.show_tooltip(event)
 
     def _show_column_menu(self, event: tk.Event) -> None:
         """Show column management menu."""
@@ -351,10 +437,17 @@ Error type: {type(e)}
 
     def show_about_dialog(self) -> None:
         """Show the about dialog."""
-        AboutDialog(self.root)
+        AboutDialog.show(self.root)
+
+    def _on_close(self) -> None:
+        """Shut down background workers and close the window."""
+        self._io_executor.shutdown(wait=False, cancel_futures=True)
+        self._translate_pool.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
 
     def run(self) -> None:
         """Start the application main loop."""
         self.root.mainloop()
         # Clean up
-        self.font_manager.unregister_callback(self._update_fonts) 
\ No newline at end of file
+        self.font_manager.unregister_callback(self._update_fonts)
+        self.lyrics_cache.close() 
\ No newline at end of file
@@ -3,47 +3,119 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 import webbrowser
-from typing import Callable
+from functools import lru_cache
+from typing import Callable, Optional
 import os
-from PIL import Image, ImageTk
 import json
+import logging
 import sys
 
+from src.gui.styles import DIALOG_FONT
 from src.gui.utils.gui_utils import center_window
 from src.config.app_config import AppConfig
 
+logger = logging.getLogger(__name__)
+
+# Static dialog content
+STEPS = (
+    "1. Click the 'Open Spotify' button below",
+    "2. Log in to Spotify if needed",
+    "3. Press F12 to open Developer Tools",
+    "4. Click 'Application' tab in Developer Tools",
+    "5. Under 'Storage' expand 'Cookies'",
+    "6. Click on 'https://spotify.com'",
+    "7. Find 'sp_dc' cookie and copy its value",
+    "8. Paste the value below"
+)
+
+SOCIAL_LINKS = (
+    ("🌐 Website", "https://notablenomads.com"),
+    ("💼 LinkedIn", "https://www.linkedin.com/in/mrdevx/"),
+    ("📧 Email", "mailto:m8rashidi@gmail.com"),
+    ("🐙 GitHub", "https://github.com/MRdevX/spotify-lyrics-translator")
+)
+
+TECHNOLOGIES = (
+    ("Spotify API", "https://developer.spotify.com"),
+    ("Syrics", "https://github.com/akashrchandran/syrics"),
+    ("Deep Translator", "https://github.com/nidhaloff/deep-translator"),
+    ("Sun Valley TTK Theme", "https://github.com/rdbende/Sun-Valley-ttk-theme")
+)
+
+def _get_version_file_path() -> str:
+    """Get the path of version.json for dev and bundled runs."""
+    # For frozen app (when bundled)
+    if getattr(sys, 'frozen', False):
+        if sys.platform == 'darwin':
+            # For macOS app bundle
+            return os.path.join(os.path.dirname(sys.executable), '..', 'Resources', 'version.json')
+        # For Windows executable
+        return os.path.join(os.path.dirname(sys.executable), 'version.json')
+    
+    # Project root directory, three levels above this file
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    project_root = os.path.abspath(os.path.join(current_dir, '..', '..', '..'))
+    return os.path.join(project_root, 'version.json')
+
+_VERSION_FILE_PATH = _get_version_file_path()
+
+@lru_cache(maxsize=1)
 def get_version() -> str:
-    """Get current version from version.json."""
+    """Get current version, embedded at build time or from version.json. The result is cached."""
     try:
-        # Get the project root directory
-        current_dir = os.path.dirname(os.path.abspath(__file__))  # dialogs.py directory
-        project_root = os.path.abspath(os.path.join(current_dir, '..', '..', '..'))
-        version_file = os.path.join(project_root, 'version.json')
-        
-        # For frozen app (when bundled)
-        if getattr(sys, 'frozen', False):
-            if sys.platform == 'darwin':
-                # For macOS app bundle
-                version_file = os.path.join(os.path.dirname(sys.executable), '..', 'Resources', 'version.json')
-            else:
-                # For Windows executable
-                version_file = os.path.join(os.path.dirname(sys.executable), 'version.json')
-        
-        print(f"Looking for version.json at: {version_file}")
-        
-        if not os.path.exists(version_file):
-            print(f"Error: version.json not found at {version_file}")
-            return "Unknown"
+        # Bundled builds embed the version, so no file needs to be read
+        from src._version import __version__
+        return __version__
+    except ImportError:
+        pass
+    
+    version_file = _VERSION_FILE_PATH
+    try:
+        logger.debug("Looking for version.json at: %s", version_file)
         
-        with open(version_file, 'r') as f:
-            version_data = json.load(f)
-            version = f"{version_data['major']}.{version_data['minor']}.{version_data['patch']}"
-            print(f"Successfully read version: {version}")
-            return version
+        # The file is tiny; read it in one go and parse the bytes directly
+        with open(version_file, 'rb', buffering=0) as f:
+            version_data = json.loads(f.read())
+        version = f"{version_data['major']}.{version_data['minor']}.{version_data['patch']}"
+        logger.debug("Successfully read version: %s", version)
+        return version
+    except FileNotFoundError:
+        logger.warning("version.json not found at %s", version_file)
+        return "Unknown"
     except Exception as e:
-        print(f"Error reading version from version.json: {str(e)}")
+        logger.warning("Error reading version from version.json: %s", e)
         return "Unknown"
 
+_ASSETS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))), 'assets')
+_ICON_PHOTO = None
+
+def _load_icon_photo(master: tk.Misc):
+    """Load the app icon at 128x128."""
+    # Prefer the pre-resized asset decoded by Tk itself (PNG support needs Tk 8.6+),
+    # which needs no resampling and no copy through Pillow
+    if tk.TkVersion >= 8.6:
+        try:
+            return tk.PhotoImage(file=os.path.join(_ASSETS_DIR, 'app_icon_128.png'), master=master)
+        except tk.TclError as e:
+            logger.debug("Falling back to Pillow for app icon: %s", e)
+    
+    # Pillow is only needed for this fallback, so import it lazily
+    from PIL import Image, ImageTk
+    image = Image.open(os.path.join(_ASSETS_DIR, 'app_icon.png'))
+    # draft() lets formats such as JPEG decode at reduced size; a no-op for PNG
+    image.draft(None, (128, 128))
+    image.thumbnail((128, 128), Image.Resampling.LANCZOS)
+    return ImageTk.PhotoImage(image, master=master)
+
+def _get_icon_photo(master: tk.Misc):
+    """Get the 128x128 app icon, reusing it after the first call."""
+    global _ICON_PHOTO
+    if _ICON_PHOTO is None:
+        _ICON_PHOTO = _load_icon_photo(master)
+        # Keep a reference on the root to prevent garbage collection
+        master.nametowidget('.')._app_icon_ref = _ICON_PHOTO
+    return _ICON_PHOTO
+
 class LoginDialog:
     """Dialog for Spotify authentication."""
 
@@ -85,28 +157,17 @@ class LoginDialog:
 
     def _add_instructions(self, container: ttk.Frame) -> None:
         """Add instruction steps to the dialog."""
-        steps = [
-            "1. Click the 'Open Spotify' button below",
-            "2. Log in to Spotify if needed",
-            "3. Press F12 to open Developer Tools",
-            "4. Click 'Application' tab in Developer Tools",
-            "5. Under 'Storage' expand 'Cookies'",
-            "6. Click on 'https://spotify.com'",
-            "7. Find 'sp_dc' cookie and copy its value",
-            "8. Paste the value below"
-        ]
-
         steps_frame = ttk.Frame(container)
         steps_frame.pack(fill=tk.BOTH, padx=20, pady=10)
 
-        for step in steps:
-            step_label = ttk.Label(
-                steps_frame,
-                text=step,
-                font=('Helvetica', 11),
-                wraplength=550
-            )
-            step_label.pack(anchor='w', pady=5)
+        # A single multi-line label lays out in one pass
+        steps_label = ttk.Label(
+            steps_frame,
+            text="\n".join(STEPS),
+            style='Dialog.TLabel',
+            justify=tk.LEFT
+        )
+        steps_label.pack(anchor='w', pady=5)
 
     def _add_buttons(self, container: ttk.Frame) -> None:
         """Add buttons to the dialog."""
@@ -129,7 +190,7 @@ class LoginDialog:
         entry_label = ttk.Label(
             entry_frame,
             text="Paste your sp_dc cookie value here:",
-            font=('Helvetica', 11)
+            style='Dialog.TLabel'
         )
         entry_label.pack(anchor='w', pady=(0, 5))
 
@@ -138,7 +199,7 @@ class LoginDialog:
             entry_frame,
             textvariable=cookie_var,
             width=50,
-            font=('Helvetica', 11)
+            font=DIALOG_FONT
         )
         cookie_entry.pack(fill=tk.X, pady=5)
 
@@ -171,6 +232,20 @@ class LoginDialog:
 class AboutDialog:
     """Dialog for displaying application information."""
 
+    _instance: Optional['AboutDialog'] = None
+
+    @classmethod
+    def show(cls, parent: tk.Tk) -> 'AboutDialog':
+        """Show the about dialog, reusing the hidden instance if there is one."""
+        instance = cls._instance
+        if instance is not None and instance.dialog.winfo_exists():
+            instance.dialog.deiconify()
+            instance.dialog.lift()
+            instance.dialog.grab_set()
+            return instance
+        cls._instance = cls(parent)
+        return cls._instance
+
     def __init__(self, parent: tk.Tk):
         self.dialog = tk.Toplevel(parent)
         self.dialog.title("About Spotify Lyrics Translator")
@@ -182,29 +257,28 @@ class AboutDialog:
         # Make dialog resizable
         self.dialog.resizable(True, True)
         
+        # Hide instead of destroying so the dialog can be reopened cheaply
+        self.dialog.protocol("WM_DELETE_WINDOW", self._close)
+        
         # Center the dialog
         center_window(self.dialog, 600, 650)
-        self._init_components()
+        
+        # Let the window appear first; build its contents when idle
+        self.dialog.after_idle(self._init_components)
 
     def _init_components(self) -> None:
         """Initialize dialog components."""
+        if not self.dialog.winfo_exists():
+            return
         main_frame = ttk.Frame(self.dialog, padding="20")
         main_frame.pack(fill=tk.BOTH, expand=True)
 
         # App Logo
         try:
-            # Get the absolute path to the icon file
-            icon_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))), 
-                                   'assets', 'app_icon.png')
-            
-            # Load and resize the image
-            image = Image.open(icon_path)
-            image = image.resize((128, 128), Image.Resampling.LANCZOS)
-            photo = ImageTk.PhotoImage(image)
+            photo = _get_icon_photo(self.dialog)
             
             # Create label with image
             logo_label = ttk.Label(main_frame, image=photo)
-            logo_label.image = photo  # Keep a reference to prevent garbage collection
             logo_label.pack(pady=(0, 10))
         except Exception as e:
             print(f"Error loading app icon: {e}")
@@ -244,7 +318,7 @@ class AboutDialog:
         desc_label = ttk.Label(
             container,
             text="A powerful desktop application that provides real-time translations of Spotify lyrics while you listen to music. Experience your favorite songs in any language with synchronized translations.",
-            font=('Helvetica', 11),
+            style='Dialog.TLabel',
             wraplength=500,
             justify=tk.CENTER
         )
@@ -259,7 +333,7 @@ class AboutDialog:
         dev_label = ttk.Label(
             author_frame,
             text="Developed by",
-            font=('Helvetica', 11)
+            style='Dialog.TLabel'
         )
         dev_label.pack()
 
@@ -275,23 +349,16 @@ class AboutDialog:
         links_frame = ttk.Frame(container)
         links_frame.pack(fill=tk.X, pady=10)
 
-        links = [
-            ("🌐 Website", "https://notablenomads.com"),
-            ("💼 LinkedIn", "https://www.linkedin.com/in/mrdevx/"),
-            ("📧 Email", "mailto:m8rashidi@gmail.com"),
-            ("🐙 GitHub", "https://github.com/MRdevX/spotify-lyrics-translator")
-        ]
-
-        for icon, url in links:
+        for icon, url in SOCIAL_LINKS:
             link_label = ttk.Label(
                 links_frame,
                 text=icon,
-                font=('Helvetica', 11),
-                cursor="hand2",
-                foreground="#1DB954"
+                style='Link.Dialog.TLabel',
+                cursor="hand2"
             )
             link_label.pack(pady=2)
-            link_label.bind("<Button-1>", lambda e, url=url: webbrowser.open(url))
+            link_label.url = url
+            link_label.bind("<Button-1>", self._on_link_click)
 
     def _add_credits(self, container: ttk.Frame) -> None:
         """Add credits information."""
@@ -305,30 +372,32 @@ class AboutDialog:
         )
         credits_label.pack(pady=(0, 5))
 
-        technologies = [
-            ("Spotify API", "https://developer.spotify.com"),
-            ("Syrics", "https://github.com/akashrchandran/syrics"),
-            ("Deep Translator", "https://github.com/nidhaloff/deep-translator"),
-            ("Sun Valley TTK Theme", "https://github.com/rdbende/Sun-Valley-ttk-theme")
-        ]
-
-        for tech, url in technologies:
+        for tech, url in TECHNOLOGIES:
             tech_label = ttk.Label(
                 credits_frame,
                 text=tech,
-                font=('Helvetica', 11),
-                cursor="hand2",
-                foreground="#1DB954"
+                style='Link.Dialog.TLabel',
+                cursor="hand2"
             )
             tech_label.pack(pady=2)
-            tech_label.bind("<Button-1>", lambda e, url=url: webbrowser.open(url))
+            tech_label.url = url
+            tech_label.bind("<Button-1>", self._on_link_click)
+
+    def _close(self) -> None:
+        """Hide the dialog."""
+        self.dialog.grab_release()
+        self.dialog.withdraw()
+
+    def _on_link_click(self, event: tk.Event) -> None:
+        """Open the URL stored on the clicked link label."""
+        webbrowser.open(event.widget.url)
 
     def _add_close_button(self, container: ttk.Frame) -> None:
         """Add close button."""
         close_button = ttk.Button(
             container,
             text="Close",
-            command=self.dialog.destroy,
+            command=self._close,
             style='Accent.TButton'
         )
         close_button.pack(pady=20)
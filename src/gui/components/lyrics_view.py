@@ -1,5 +1,6 @@
 """Lyrics view component for displaying and managing lyrics."""
 
+import bisect
 import tkinter as tk
 from tkinter import ttk
 from typing import Dict, List, Optional, Tuple, Callable
@@ -17,6 +18,16 @@ class LyricsView:
         self.tree: Optional[ttk.Treeview] = None
         self.tooltip: Optional[tk.Toplevel] = None
         self.language: str = ""
+        self._start_times_ms: List[int] = []
+        self._row_ids: List[str] = []
+        self._last_active_idx: int = -1
+        self._max_orig_len: int = 0
+        self._max_trans_len: int = 0
+        self._anim_id: Optional[str] = None
+        self._anim_state: Dict[str, Tuple[int, int]] = {}
+        self._anim_steps: int = 10
+        self._font_measure_cache: Dict[str, int] = {}
+        self._last_tooltip_cell: Tuple[Optional[str], Optional[str]] = (None, None)
         self.default_widths = {
             "Time": 60,
             "Original Lyrics": 350,
@@ -88,44 +99,87 @@ class LyricsView:
             rowheight=max(30, row_font[1] * 2)  # Adjust row height based on font size
         )
         
+        # Cached text measurements are only valid for the previous font
+        self._font_measure_cache.clear()
+        
         # Force treeview to redraw
         self.tree.update_idletasks()
 
     def bind_events(self, tooltip_callback: Callable, menu_callback: Callable) -> None:
         """Bind event handlers to the treeview."""
         self.tree.bind('<Motion>', tooltip_callback)
+        self.tree.bind('<Leave>', lambda e: self.hide_tooltip())
         self.tree.bind('<Button-3>', menu_callback)
 
+    def show_tooltip(self, event: tk.Event) -> None:
+        """Show full cell text when it is truncated by the column width."""
+        item = self.tree.identify_row(event.y)
+        column = self.tree.identify_column(event.x)
+        if (item, column) == self._last_tooltip_cell:
+            return
+        self._last_tooltip_cell = (item, column)
+        self._destroy_tooltip()
+        
+        if not item or not column:
+            return
+        cell_value = str(self.tree.set(item, column))
+        if not cell_value:
+            return
+        
+        text_width = self._font_measure_cache.get(cell_value)
+        if text_width is None:
+            font = ttk.Style().lookup("Treeview", "font")
+            text_width = int(self.tree.tk.call('font', 'measure', font, cell_value))
+            self._font_measure_cache[cell_value] = text_width
+        
+        col_width = int(self.tree.column(column, option='width'))
+        if text_width <= col_width - 10:
+            return
+        
+        self.tooltip = tk.Toplevel(self.tree)
+        self.tooltip.wm_overrideredirect(True)
+        self.tooltip.wm_geometry(f"+{event.x_root + 15}+{event.y_root + 10}")
+        ttk.Label(
+            self.tooltip,
+            text=cell_value,
+            font=self.font_manager.get_font('Helvetica', 'normal'),
+            padding=5
+        ).pack()
+
+    def hide_tooltip(self) -> None:
+        """Hide the tooltip, if shown."""
+        self._last_tooltip_cell = (None, None)
+        self._destroy_tooltip()
+
+    def _destroy_tooltip(self) -> None:
+        """Destroy the tooltip window."""
+        if self.tooltip is not None:
+            self.tooltip.destroy()
+            self.tooltip = None
+
     def clear(self) -> None:
         """Clear all items from the treeview."""
+        self.hide_tooltip()
         self.tree.delete(*self.tree.get_children())
+        self._start_times_ms = []
+        self._row_ids = []
+        self._last_active_idx = -1
+        self._max_orig_len = 0
+        self._max_trans_len = 0
 
     def insert_message(self, time: str, message: str) -> None:
         """Insert a message row into the treeview."""
         self.tree.insert("", "end", values=(time, message, ""))
+        self._max_orig_len = max(self._max_orig_len, len(message))
 
     def update_current_lyric(self, current_position: int) -> None:
         """Update the currently playing lyric."""
         try:
-            last_index = None
-            for item in self.tree.get_children():
-                item_data = self.tree.item(item)
-                time_parts = item_data['values'][0].split(":")
-                if len(time_parts) == 2:
-                    try:
-                        minutes = int(time_parts[0])
-                        seconds = int(time_parts[1])
-                        start_time = minutes * 60000 + seconds * 1000
-                        if start_time <= current_position:
-                            last_index = item
-                        else:
-                            break
-                    except (ValueError, IndexError):
-                        continue
-            
-            if last_index:
-                self.tree.selection_set(last_index)
-                self.tree.see(last_index)
+            idx = bisect.bisect_right(self._start_times_ms, current_position) - 1
+            if idx >= 0 and idx != self._last_active_idx:
+                self.tree.selection_set(self._row_ids[idx])
+                self.tree.see(self._row_ids[idx])
+                self._last_active_idx = idx
         except Exception as e:
             print(f"Error updating current lyric: {e}")
 
@@ -134,32 +188,33 @@ class LyricsView:
         self.language = detected_lang
         self.tree.heading("Original Lyrics", text=f"Original Lyrics ({detected_lang})")
 
+        valid_lyrics = []
         for lyric in lyrics_data:
             if not isinstance(lyric, dict) or 'startTimeMs' not in lyric or 'words' not in lyric:
                 print(f"Invalid lyric format: {lyric}")
                 continue
-            self.tree.insert("", "end", values=(
-                ms_to_min_sec(lyric['startTimeMs']),
-                lyric['words'],
-                ""
-            ))
+            valid_lyrics.append(lyric)
+        
+        times = [ms_to_min_sec(lyric['startTimeMs']) for lyric in valid_lyrics]
+        
+        # Insert through Tcl directly to skip Treeview.insert's per-row option formatting
+        tk_call = self.tree.tk.call
+        tree_path = str(self.tree)
+        self._row_ids.extend(
+            tk_call(tree_path, 'insert', '', 'end', '-values', (time, lyric['words'], ''))
+            for time, lyric in zip(times, valid_lyrics)
+        )
+        self._start_times_ms.extend(int(lyric['startTimeMs']) for lyric in valid_lyrics)
+        self._max_orig_len = max(
+            [self._max_orig_len] + [len(lyric['words']) for lyric in valid_lyrics])
 
     def update_translations(self, translated_lyrics: List[Dict]) -> None:
         """Update translations in the treeview."""
-        for item in self.tree.get_children():
-            item_data = self.tree.item(item)
-            start_time = item_data['values'][0]
-            original_lyrics = item_data['values'][1]
-            for lyric in translated_lyrics:
-                if (ms_to_min_sec(lyric['startTimeMs']) == start_time and
-                    lyric['words'] == original_lyrics):
-                    self.tree.set(item, column="Translated Lyrics", value=lyric['translated'])
-                    break
-        
-        if self.tree.get_children():
-            first_item = self.tree.get_children()[0]
-            self.tree.set(first_item, column="Translated Lyrics",
-                         value=translated_lyrics[0]['translated'])
+        # Rows are inserted in lyric order and translations preserve it,
+        # so match them up by position.
+        for item, lyric in zip(self.tree.get_children(), translated_lyrics):
+            self.tree.set(item, column="Translated Lyrics", value=lyric['translated'])
+        self._max_trans_len = max((len(lyric['translated']) for lyric in translated_lyrics), default=0)
 
     def adjust_column_widths(self, window_width: int) -> None:
         """Adjust column widths based on content and window size."""
@@ -172,38 +227,48 @@ class LyricsView:
 
     def _calculate_max_content_lengths(self) -> Tuple[int, int]:
         """Calculate maximum content lengths for lyrics columns."""
-        max_original_length = 0
-        max_translated_length = 0
-        
-        for item in self.tree.get_children():
-            values = self.tree.item(item)['values']
-            max_original_length = max(max_original_length, len(values[1]))
-            max_translated_length = max(max_translated_length, len(values[2]))
-        
-        return max_original_length, max_translated_length
+        return self._max_orig_len, self._max_trans_len
 
     def _apply_column_widths(self, widths: Dict[str, int]) -> None:
         """Apply calculated column widths."""
+        # A running animation would overwrite the widths set below
+        self._cancel_animation()
+        targets = {}
         for col, new_width in widths.items():
-            old_width = self.tree.column(col)['width']
+            old_width = int(self.tree.column(col, option='width'))
             if abs(old_width - new_width) > 5:
-                self._smooth_resize(col, old_width, new_width)
+                targets[col] = (old_width, new_width)
             else:
                 self.tree.column(col, width=new_width)
+        if targets:
+            self._animate_columns(targets)
 
-    def _smooth_resize(self, column: str, start_width: int, end_width: int, steps: int = 10) -> None:
-        """Animate column resizing."""
-        if steps <= 0:
-            self.tree.column(column, width=end_width)
-            return
-        
-        progress = (10 - steps) / 10
-        current_width = start_width + (end_width - start_width) * progress
-        self.tree.column(column, width=int(current_width))
+    def _animate_columns(self, targets: Dict[str, Tuple[int, int]], steps: int = 10) -> None:
+        """Animate column resizing, stepping all columns together."""
+        self._cancel_animation()
+        self._anim_state = targets
+        self._anim_steps = steps
+        self._animate_step(steps)
+
+    def _cancel_animation(self) -> None:
+        """Stop any column resize animation in progress."""
+        if self._anim_id is not None:
+            self.container.after_cancel(self._anim_id)
+            self._anim_id = None
+
+    def _animate_step(self, steps_left: int) -> None:
+        """Advance the column resize animation by one frame."""
+        progress = 1 - steps_left / self._anim_steps
+        for col, (start_width, end_width) in self._anim_state.items():
+            self.tree.column(col, width=int(start_width + (end_width - start_width) * progress))
         
-        self.container.after(20, lambda: self._smooth_resize(column, start_width, end_width, steps-1))
+        if steps_left > 0:
+            self._anim_id = self.container.after(20, self._animate_step, steps_left - 1)
+        else:
+            self._anim_id = None
 
     def reset_column_widths(self) -> None:
         """Reset columns to default widths."""
+        self._cancel_animation()
         for col, width in self.default_widths.items():
             self.tree.column(col, width=width) 
\ No newline at end of file
@@ -2,7 +2,7 @@
 
 import tkinter as tk
 from tkinter import ttk
-from typing import Dict
+from typing import Dict, Optional, Tuple
 
 from src.utils.time_utils import ms_to_min_sec
 from src.gui.utils.font_manager import FontManager
@@ -19,6 +19,13 @@ class PlayerInfo:
         self.progress_var: tk.DoubleVar
         self.progress_bar: ttk.Progressbar
         
+        # Last values drawn, to skip redundant widget updates
+        self._drawn_text: Dict[str, str] = {}
+        self._last_progress: Optional[float] = None
+        self._last_time_key: Optional[Tuple[int, int]] = None
+        self._total_duration: Optional[int] = None
+        self._total_time_str: str = "0:00"
+        
         self._init_components()
 
     def _init_components(self) -> None:
@@ -75,24 +82,46 @@ class PlayerInfo:
         album_name = song_data['item']['album']['name']
         
         song_display = f"{song_name} - {artist_name}"
-        self.song_label.config(text=song_display)
-        self.album_label.config(text=album_name)
+        self._set_text(self.song_label, song_display)
+        self._set_text(self.album_label, album_name)
 
     def update_progress(self, current_position: int, duration: int) -> None:
         """Update progress bar and time display."""
-        current_time = ms_to_min_sec(current_position)
-        total_time = ms_to_min_sec(duration)
-        self.time_label.config(text=f"{current_time} / {total_time}")
+        # The duration is fixed per song; only format it when it changes
+        if duration != self._total_duration:
+            self._total_duration = duration
+            self._total_time_str = ms_to_min_sec(duration)
+        
+        # The time label only changes once per second
+        time_key = (current_position // 1000, duration)
+        if time_key != self._last_time_key:
+            self._last_time_key = time_key
+            current_time = ms_to_min_sec(current_position)
+            self._set_text(self.time_label, f"{current_time} / {self._total_time_str}")
         
-        progress_percent = (current_position / duration) * 100 if duration > 0 else 0
-        self.progress_var.set(progress_percent)
+        # Round to 0.5% steps; finer changes are not visible on the bar
+        progress_percent = round((current_position / duration) * 200) / 2.0 if duration > 0 else 0
+        self._set_progress(progress_percent)
 
     def clear_display(self) -> None:
         """Clear the display when no song is playing."""
-        self.song_label.config(text="No song playing")
-        self.album_label.config(text="")
-        self.time_label.config(text="0:00 / 0:00")
-        self.progress_var.set(0)
+        self._set_text(self.song_label, "No song playing")
+        self._set_text(self.album_label, "")
+        self._set_text(self.time_label, "0:00 / 0:00")
+        self._last_time_key = None
+        self._set_progress(0)
+
+    def _set_text(self, label: ttk.Label, text: str) -> None:
+        """Set label text only if it differs from what is displayed."""
+        if self._drawn_text.get(str(label)) != text:
+            label.config(text=text)
+            self._drawn_text[str(label)] = text
+
+    def _set_progress(self, progress_percent: float) -> None:
+        """Set progress bar value only if it changed."""
+        if progress_percent != self._last_progress:
+            self.progress_var.set(progress_percent)
+            self._last_progress = progress_percent
 
     def update_fonts(self, font_manager: FontManager) -> None:
         """Update component fonts."""
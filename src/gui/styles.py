@@ -1,7 +1,12 @@
 """GUI styles configuration."""
 
+import tkinter.font as tkfont
 import tkinter.ttk as ttk
 
+# Named font shared by dialog body text
+DIALOG_FONT = "DialogFont"
+_dialog_font = None
+
 def configure_styles(style: ttk.Style) -> None:
     """Configure custom styles for the application."""
     style.configure(
@@ -47,4 +52,24 @@ def configure_styles(style: ttk.Style) -> None:
         background='#1DB954',
         darkcolor='#1DB954',
         lightcolor='#1DB954'
-    ) 
\ No newline at end of file
+    )
+    
+    configure_dialog_styles(style)
+
+def configure_dialog_styles(style: ttk.Style) -> None:
+    """Configure styles shared by dialog labels."""
+    global _dialog_font
+    if DIALOG_FONT not in tkfont.names(style.master):
+        # Keep a reference; the named font is deleted when the object is collected
+        _dialog_font = tkfont.Font(style.master, name=DIALOG_FONT, family='Helvetica', size=11)
+    
+    style.configure(
+        "Dialog.TLabel",
+        font=DIALOG_FONT,
+        wraplength=550
+    )
+    
+    style.configure(
+        "Link.Dialog.TLabel",
+        foreground='#1DB954'  # Spotify green
+    )
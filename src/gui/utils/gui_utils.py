@@ -47,6 +47,14 @@ def calculate_column_widths(
 
 def center_window(window, width: int, height: int) -> None:
     """Center a window on the screen."""
-    x = (window.winfo_screenwidth() // 2) - (width // 2)
-    y = (window.winfo_screenheight() // 2) - (height // 2)
+    # Cache the screen size on the root window to avoid repeated queries
+    root = window.nametowidget('.')
+    screen = getattr(root, '_cached_screen', None)
+    if screen is None:
+        screen = (root.winfo_screenwidth(), root.winfo_screenheight())
+        root._cached_screen = screen
+    screen_width, screen_height = screen
+    
+    x = (screen_width // 2) - (width // 2)
+    y = (screen_height // 2) - (height // 2)
     window.geometry(f'{width}x{height}+{x}+{y}') 
\ No newline at end of file